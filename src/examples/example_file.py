@@ -13,6 +13,7 @@ Watches the current directory for documents; each event is committed to the
 
 from __future__ import annotations
 
+import os
 import time
 from pathlib import Path
 
@@ -40,6 +41,14 @@ documents = Stream(DocumentEvent, name="documents")
 app = App(id="file-demo", streams=[documents])
 
 
+def _safe_size(path) -> int:
+    """File size in one stat syscall; 0 when the file is already gone."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
 class DocumentWatcher(FileEventBase):
     """Monitor documents; each event emits a DocumentEvent."""
 
@@ -47,8 +56,7 @@ class DocumentWatcher(FileEventBase):
 
     def on_file_created(self, event):
         src = Path(event.src_path)
-        size = src.stat().st_size if src.exists() else 0
-        print(f"📄 Created: {src.name} ({size} bytes)")
+        print(f"📄 Created: {src.name} ({_safe_size(event.src_path)} bytes)")
 
     def on_file_modified(self, event):
         print(f"📝 Modified: {Path(event.src_path).name}")
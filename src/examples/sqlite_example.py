@@ -12,6 +12,7 @@ Tracks row-level changes (inserts, updates, deletes) in a demo database.
 
 from __future__ import annotations
 
+import atexit
 import sqlite3
 import time
 from pathlib import Path
@@ -61,9 +62,41 @@ class DatabaseSync(SQLiteEventBase):
         print(f"Started monitoring database: {self._db_path}")
 
 
+# One connection per database path, shared by the demo helpers — each
+# sqlite3.connect re-parses the DB header and re-applies PRAGMAs.
+_conn_cache: dict[str, sqlite3.Connection] = {}
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """WAL + relaxed sync: cheap commits for the demo."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+
+
+def _get_conn(db_path: str) -> sqlite3.Connection:
+    """Cached connection for `db_path`, created and configured on first use."""
+    conn = _conn_cache.get(db_path)
+    if conn is None:
+        conn = sqlite3.connect(db_path)
+        _apply_pragmas(conn)
+        _conn_cache[db_path] = conn
+    return conn
+
+
+def _close_conns() -> None:
+    for conn in _conn_cache.values():
+        conn.close()
+    _conn_cache.clear()
+
+
+atexit.register(_close_conns)
+
+
 def setup_test_db(db_path: str):
     """Create test database."""
-    conn = sqlite3.connect(db_path)
+    conn = _get_conn(db_path)
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS events (
@@ -74,18 +107,20 @@ def setup_test_db(db_path: str):
         """
     )
     conn.commit()
-    conn.close()
 
 
 def add_test_data(db_path: str):
     """Add rows, update one, delete one to trigger monitoring."""
-    conn = sqlite3.connect(db_path)
+    conn = _get_conn(db_path)
 
-    for i in range(3):
-        conn.execute("INSERT INTO events (name) VALUES (?)", (f"Event {i + 1}",))
-        conn.commit()
-        print(f"  Added: Event {i + 1}")
-        time.sleep(0.5)
+    # One transaction -> one fsync for all inserts (vs commit-per-row).
+    conn.executemany(
+        "INSERT INTO events (name) VALUES (?)",
+        [(f"Event {i + 1}",) for i in range(3)],
+    )
+    conn.commit()
+    print("  Added: Events 1-3 (single transaction)")
+    time.sleep(1.5)  # let the monitor observe the batch before mutating it
 
     conn.execute("UPDATE events SET name='Updated Event' WHERE id=1")
     conn.commit()
@@ -95,8 +130,6 @@ def add_test_data(db_path: str):
     conn.commit()
     print("  Deleted: row 2")
 
-    conn.close()
-
 
 def main():
     print("🚀 SQLite Monitor Demo")
@@ -118,6 +151,7 @@ def main():
         store.close()
 
     print("\n✅ Monitoring complete")
+    _close_conns()  # release the cached handle before removing the file
     Path(db_path).unlink(missing_ok=True)
 
 
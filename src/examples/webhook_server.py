@@ -5,6 +5,7 @@
 #     "eventic>=1.1.0",
 #     "requests>=2.31.0",
 #     "typer>=0.12.0",
+#     "orjson>=3.9",
 # ]
 # ///
 """
@@ -15,22 +16,198 @@ by binding a store with a reachable database.
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
+import os
+import queue
 import signal
 import sys
+import threading
 import time
+from collections import deque
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
 import typer
 from eventic import App, Stream
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 from observantic import WebhookEventBase, make_store
 
+try:  # optional fast path: orjson emits bytes and is several times faster
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 app = typer.Typer()
 
 
+# Fixed log-entry schema: .copy() of a presized dict skips the hash/grow
+# work of building the literal from scratch on every request.
+_LOG_TEMPLATE: dict = {
+    "timestamp": None,
+    "request_number": None,
+    "path": None,
+    "method": None,
+    "headers": None,
+    "source_ip": None,
+    "query_params": None,
+    "body": None,
+    "body_type": None,
+    "body_size": None,
+}
+
+# Entry dicts are short-lived (serialized, then dead); recycling them
+# through a pool avoids per-request allocation and minor-GC churn.
+# deque.pop/append are GIL-atomic, so handler threads need no lock.
+_log_entry_pool: deque = deque(maxlen=512)
+
+
+def _acquire_log_entry() -> dict:
+    try:
+        return _log_entry_pool.pop()
+    except IndexError:
+        return _LOG_TEMPLATE.copy()
+
+
+def _release_log_entry(entry: dict) -> None:
+    # Every key is overwritten on acquire (fixed schema), so no clear().
+    _log_entry_pool.append(entry)
+
+
+# [epoch_second, formatted] — at high request rates thousands of webhooks
+# share a wall second; format the ISO string once per second, not per call.
+_ts_cache: list = [0, ""]
+
+
+def _iso_now() -> str:
+    """UTC ISO timestamp, cached at 1-second granularity."""
+    s = int(time.time())
+    if s != _ts_cache[0]:
+        _ts_cache[0] = s
+        _ts_cache[1] = datetime.fromtimestamp(s, timezone.utc).isoformat()
+    return _ts_cache[1]
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize to JSON bytes; orjson when installed, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+class _LogFlusher(threading.Thread):
+    """Drain queued JSONL lines into their target files with batched writes.
+
+    The HTTP handler path only pays for a ``queue.put``; this daemon thread
+    owns one raw append fd per target file (opened once — the main log and
+    errors.jsonl share the thread and the drain loop) and amortizes the
+    write syscall across up to ``max_batch`` entries or ``flush_interval``
+    seconds, whichever comes first. ``stop()`` drains the queue so no
+    entries are lost on graceful shutdown.
+    """
+
+    def __init__(self, max_batch: int | None = None, flush_interval: float | None = None) -> None:
+        super().__init__(daemon=True, name="webhook-log-flusher")
+        self._queue: queue.SimpleQueue[tuple[Path, bytes]] = queue.SimpleQueue()
+        # Deployment knobs, matching the server's envvar-driven options.
+        if max_batch is None:
+            max_batch = int(os.getenv("WEBHOOK_BATCH_SIZE", "256"))
+        if flush_interval is None:
+            flush_interval = int(os.getenv("WEBHOOK_BATCH_MS", "100")) / 1000
+        self._max_batch = max_batch
+        self._flush_interval = flush_interval
+        self._stopping = threading.Event()
+        # Last reported I/O failure per target, so a failure storm prints
+        # one line per distinct error instead of one per flush tick.
+        self._io_errors: dict[Path, str] = {}
+
+    def put(self, path: Path, line: bytes) -> None:
+        self._queue.put((path, line))
+
+    def run(self) -> None:
+        # Raw fds, opened once per file: O_APPEND writes skip the
+        # TextIOWrapper/BufferedWriter stack and are atomic appends on Linux.
+        fds: dict[Path, int] = {}
+        batches: dict[Path, list[bytes]] = {}
+        pending = 0
+        try:
+            last_flush = time.monotonic()
+            while not (self._stopping.is_set() and self._queue.empty()):
+                try:
+                    path, line = self._queue.get(timeout=self._flush_interval)
+                    batches.setdefault(path, []).append(line)
+                    pending += 1
+                except queue.Empty:
+                    pass
+                if pending and (
+                    pending >= self._max_batch
+                    or time.monotonic() - last_flush >= self._flush_interval
+                    or self._stopping.is_set()
+                ):
+                    pending = self._flush(fds, batches)
+                    last_flush = time.monotonic()
+            self._flush(fds, batches)
+            for fd in fds.values():
+                try:
+                    os.fsync(fd)  # durability once, at shutdown — not per batch
+                except OSError:
+                    pass
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+
+    def _flush(self, fds: dict[Path, int], batches: dict[Path, list[bytes]]) -> int:
+        """Write each file's accumulated batch in one os.write; returns 0.
+
+        A failing target must never kill the flusher thread — the handler
+        path keeps queueing, so a dead flusher means silent log loss plus
+        unbounded queue growth. On OSError (ENOSPC, permissions, …) the
+        batch is dropped, the broken fd is discarded so the next batch
+        retries the open, and the failure is reported to stderr once per
+        distinct error rather than once per tick.
+        """
+        for path, batch in batches.items():
+            if not batch:
+                continue
+            try:
+                fd = fds.get(path)
+                if fd is None:
+                    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    fds[path] = fd
+                os.write(fd, b"".join(batch))
+            except OSError as e:
+                stale = fds.pop(path, None)
+                if stale is not None:
+                    try:
+                        os.close(stale)
+                    except OSError:
+                        pass
+                message = f"{type(e).__name__}: {e}"
+                if self._io_errors.get(path) != message:
+                    self._io_errors[path] = message
+                    print(
+                        f"⚠️  log flush to {path} failed ({message}); "
+                        "dropping batch",
+                        file=sys.stderr,
+                    )
+            else:
+                if self._io_errors.pop(path, None) is not None:
+                    print(f"✅ log flush to {path} recovered", file=sys.stderr)
+            # Dropped or written, the batch is done — holding failed lines
+            # would grow without bound while the target stays unwritable.
+            batch.clear()
+        return 0
+
+    def stop(self) -> None:
+        """Signal shutdown and wait for the queue to drain (bounded)."""
+        self._stopping.set()
+        if self.is_alive():
+            self.join(timeout=5)
+
+
 class WebhookEvent(BaseModel):
     """One emitted webhook request (the stream's state model)."""
 
@@ -56,59 +233,91 @@ class WebhookLogger(WebhookEventBase):
     parse_json_body: bool = True
 
     _log_file: Path = Path("/data/webhooks.jsonl")
-    _request_count: int = 0
+    # next() on itertools.count is atomic under the GIL — race-free request
+    # numbers across the server's handler threads, no lock needed.
+    _request_counter: Iterator[int] = PrivateAttr(
+        default_factory=lambda: itertools.count(1)
+    )
+    _request_count: int = 0  # last issued number, for the shutdown summary
+    _flusher: _LogFlusher | None = None
+
+    def _ensure_flusher(self) -> _LogFlusher:
+        """Start the background log flusher on first use (idempotent)."""
+        flusher = self._flusher
+        if flusher is None:
+            self._log_file.parent.mkdir(parents=True, exist_ok=True)
+            flusher = _LogFlusher()
+            flusher.start()
+            atexit.register(flusher.stop)  # drain on interpreter exit
+            self._flusher = flusher
+        return flusher
 
     def on_webhook_received(self, event):
         """Process and log incoming webhook."""
-        self._request_count += 1
+        req_num = next(self._request_counter)
+        self._request_count = req_num
+        now_iso = _iso_now()  # cached per wall second
 
         try:
-            # Create comprehensive log entry
-            log_entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "request_number": self._request_count,
-                "path": event.path,
-                "method": event.method,
-                "headers": event.headers,
-                "source_ip": event.source_ip,
-                "query_params": event.query_params,
-                "body": event.body,
-                "body_type": type(event.body).__name__,
-                "body_size": len(str(event.body)),
-            }
-
-            # Ensure directory exists
-            self._log_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Append to JSONL
-            with open(self._log_file, "a") as f:
-                f.write(json.dumps(log_entry, default=str) + "\n")
-
-            # Console output with details
-            body_preview = self._format_body_preview(event.body)
+            # Serialize the body once; size and preview derive from the
+            # same buffer instead of re-stringifying per field.
+            body_bytes = self._serialize_body(event.body)
+
+            # Create comprehensive log entry (pooled dict, fixed schema)
+            log_entry = _acquire_log_entry()
+            log_entry["timestamp"] = now_iso
+            log_entry["request_number"] = req_num
+            log_entry["path"] = event.path
+            log_entry["method"] = event.method
+            log_entry["headers"] = event.headers
+            log_entry["source_ip"] = event.source_ip
+            log_entry["query_params"] = event.query_params
+            log_entry["body"] = event.body
+            log_entry["body_type"] = type(event.body).__name__
+            log_entry["body_size"] = len(body_bytes)
+
+            # Enqueue for the background flusher — no file I/O on the
+            # request thread.
+            self._ensure_flusher().put(self._log_file, _dump_json(log_entry) + b"\n")
+            _release_log_entry(log_entry)  # serialized above; safe to recycle
+
+            # Console output with details — one print (one stdout-lock
+            # acquisition, and one write syscall on line-buffered TTYs).
+            body_preview = self._format_body_preview(body_bytes)
             print(
-                f"✓ [{self._request_count}] {event.method} {event.path} "
-                f"from {event.source_ip}"
+                f"✓ [{req_num}] {event.method} {event.path} "
+                f"from {event.source_ip}\n"
+                f"  Headers: {len(event.headers)} | Body: {body_preview}"
             )
-            print(f"  Headers: {len(event.headers)} | Body: {body_preview}")
 
         except Exception as e:
             print(f"✗ Error processing webhook: {e}")
-            self.on_error(e, event)
+            self.on_error(e, event, now_iso=now_iso)
 
-    def _format_body_preview(self, body, max_length=100):
-        """Format body preview for console output."""
+    @staticmethod
+    def _serialize_body(body) -> bytes:
+        """Serialize the body to bytes exactly once per request."""
+        if isinstance(body, bytes):
+            return body
         if isinstance(body, dict):
-            preview = json.dumps(body, separators=(",", ":"))
-        else:
-            preview = str(body)
+            return _dump_json(body)
+        return str(body).encode("utf-8", "replace")
+
+    def _format_body_preview(self, body_bytes: bytes, max_length=100):
+        """Format body preview for console output (from pre-serialized bytes).
 
-        if len(preview) > max_length:
-            return preview[:max_length] + "..."
-        return preview
+        Only the first ``max_length`` bytes are ever materialized — a
+        memoryview slice keeps preview cost O(max_length) even for large
+        payloads.
+        """
+        if len(body_bytes) > max_length:
+            head = memoryview(body_bytes)[:max_length].tobytes()
+            return head.decode("utf-8", "replace") + "..."
+        return body_bytes.decode("utf-8", "replace")
 
     def on_start(self):
         """Called when server starts."""
+        self._ensure_flusher()  # mkdir + open the log once, not per request
         print(f"\n{'=' * 50}")
         print("🚀 Webhook Server Started")
         print(f"{'=' * 50}")
@@ -121,36 +330,64 @@ class WebhookLogger(WebhookEventBase):
 
     def on_stop(self):
         """Called when server stops."""
+        flusher = self._flusher
+        self._flusher = None
+        if flusher is not None:
+            flusher.stop()  # drain queued entries before reporting
         print(f"\n✅ Server stopped after {self._request_count} requests")
 
-    def on_error(self, error: Exception, event=None):
+    def on_error(self, error: Exception, event=None, now_iso: str | None = None):
         """Log errors (never leaks to clients; see webhook monitor)."""
         error_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now_iso or _iso_now(),
             "error": str(error),
             "error_type": type(error).__name__,
             "event_path": getattr(event, "path", None) if event else None,
         }
 
         try:
-            with open(self._log_file.parent / "errors.jsonl", "a") as f:
-                f.write(json.dumps(error_entry) + "\n")
+            # Same deferred-write path as the main log: no open/close per
+            # error, which matters most during failure storms.
+            self._ensure_flusher().put(
+                self._log_file.parent / "errors.jsonl",
+                _dump_json(error_entry) + b"\n",
+            )
         except Exception:
             pass
 
         print(f"❌ Error: {error}")
 
 
+def _parse_paths(paths: str) -> list[str]:
+    """Normalize --paths once at config time: strip, leading slash, dedupe.
+
+    The request handler compares the URL path verbatim, so all string
+    munging happens here rather than per request.
+    """
+    normalized: list[str] = []
+    for p in paths.split(","):
+        p = p.strip()
+        if not p:
+            continue
+        if not p.startswith("/"):
+            p = "/" + p
+        if p not in normalized:
+            normalized.append(p)
+    return normalized
+
+
 # Global instance for signal handling
 server_instance: WebhookLogger | None = None
 
+# Set from the signal handler; main() blocks on it with zero wakeups
+# (vs. the old sleep(1) loop: one kernel wakeup per second forever).
+_shutdown = threading.Event()
+
 
 def signal_handler(sig, frame):
     """Handle shutdown signals gracefully."""
     print("\n\n🛑 Shutdown signal received...")
-    if server_instance and server_instance._watching:
-        server_instance.stop_watching()
-    sys.exit(0)
+    _shutdown.set()
 
 
 @app.command()
@@ -203,13 +440,19 @@ def main(
     """Run production webhook server with Observantic."""
     global server_instance
 
+    # Piped/redirected stdout (containers, systemd) gets block buffering:
+    # console chatter stops costing a write syscall per webhook. TTYs keep
+    # line buffering for interactive use.
+    if not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     # Persistence is explicit: build a store from --database-url and bind.
     # If the database is unreachable, the server still runs — persistence
     # is simply unavailable (auto_persist is off until bind succeeds).
     server_instance = WebhookLogger(
         port=port,
         host=host,
-        webhook_paths=[p.strip() for p in paths.split(",")],
+        webhook_paths=_parse_paths(paths),
         parse_json_body=parse_json,
         require_auth_header=auth_header,
         require_auth_value=auth_value,
@@ -231,8 +474,7 @@ def main(
 
     server_instance.start_watching()
     try:
-        while True:
-            time.sleep(1)
+        _shutdown.wait()  # blocks without polling until SIGINT/SIGTERM
     except KeyboardInterrupt:
         pass
     finally:
@@ -16,10 +16,10 @@ Guiding principles:
 from __future__ import annotations
 
 import logging
+import queue
 from abc import ABC
-from collections import defaultdict
 from collections.abc import Callable
-from threading import Lock, Semaphore
+from threading import Lock, Semaphore, Thread
 from typing import Any
 
 from eventic import Stream
@@ -43,6 +43,9 @@ logger = logging.getLogger("observantic")
 # _SerializedStaticPool, same finding).
 _persist_lock = Semaphore(1)
 
+# Sentinel that closes a watcher's persistence queue on stop.
+_PERSIST_STOP: Any = object()
+
 HookFn = Callable[..., Any]
 
 
@@ -73,21 +76,45 @@ class EventWatcher(BaseModel, ABC):
         default=False,
         description="Raise ConfigurationException when auto_persist is requested but no Collection is bound",
     )
+    persist_async: bool = Field(
+        default=False,
+        description=(
+            "Commit emitted states from a background worker instead of the "
+            "observer/handler thread (acknowledge first, persist later); "
+            "stop_watching() drains the queue"
+        ),
+    )
+    persist_batch_size: int = Field(
+        default=100,
+        description=(
+            "Max states the async persistence worker commits per "
+            "persist-lock acquisition"
+        ),
+    )
     raise_on_hook_error: bool = Field(
         default=False,
         description="Collect hook errors instead of swallowing them",
     )
 
-    _hooks: dict[str, list[HookFn]] = PrivateAttr(
-        default_factory=lambda: defaultdict(list)
-    )
+    _hooks: dict[str, list[HookFn]] = PrivateAttr(default_factory=dict)
+    _hook_method_cache: dict[str, HookFn | None] = PrivateAttr(default_factory=dict)
     _watching: bool = PrivateAttr(default=False)
     _lock: Lock = PrivateAttr(default_factory=Lock)
     _last_hook_error: Exception | None = PrivateAttr(default=None)
     _runtime: Runtime | None = PrivateAttr(default=None)
     _collection: Collection[Any] | None = PrivateAttr(default=None)
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    _persist_queue: Any = PrivateAttr(default=None)
+    _persist_thread: Thread | None = PrivateAttr(default=None)
+
+    # Explicitly pin the cheap runtime profile: no per-assignment
+    # re-validation (watcher state flips like _watching happen on hot
+    # paths), no silently-ignored extra init kwargs, not frozen.
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        validate_assignment=False,
+        extra="forbid",
+        frozen=False,
+    )
 
     # ---- hook registry -------------------------------------------------- #
 
@@ -96,13 +123,19 @@ class EventWatcher(BaseModel, ABC):
         if not callable(callback):
             raise ConfigurationException(f"Hook must be callable, got {type(callback)}")
         with self._lock:
-            self._hooks[event_name].append(callback)
+            # Copy-on-write: replace the list instead of mutating it, so
+            # dispatch can read the current reference without a lock or a
+            # per-event defensive copy (assignment is atomic under the GIL).
+            self._hooks[event_name] = self._hooks.get(event_name, []) + [callback]
 
     def unregister_hook(self, event_name: str, callback: HookFn) -> None:
         """Remove a previously registered callback (no-op if absent)."""
         with self._lock:
-            if event_name in self._hooks and callback in self._hooks[event_name]:
-                self._hooks[event_name].remove(callback)
+            current = self._hooks.get(event_name)
+            if current and callback in current:
+                replacement = list(current)
+                replacement.remove(callback)
+                self._hooks[event_name] = replacement
 
     # ---- lifecycle state machine ---------------------------------------- #
 
@@ -133,6 +166,7 @@ class EventWatcher(BaseModel, ABC):
         except Exception as e:
             self._safe_call("on_error", e, None)
         finally:
+            self._drain_persist_worker()  # flush queued states first
             self._safe_call("on_stop")
 
     # ---- subclass extension points -------------------------------------- #
@@ -197,17 +231,42 @@ class EventWatcher(BaseModel, ABC):
                     self._last_hook_error = e
         return self._last_hook_error if self.raise_on_hook_error else None
 
+    def _hook_method(self, event_name: str) -> HookFn | None:
+        """Bound override method for an event name, resolved once.
+
+        eventic 1.1 has no metaclass wrappers — a plain ``getattr`` is the
+        raw hook; no unwrapping is needed. Methods cannot change at
+        runtime, so the lookup is cached and hot-path dispatch pays one
+        dict hit instead of getattr + callable per event.
+        """
+        cache = self._hook_method_cache
+        if event_name not in cache:
+            candidate = getattr(self, event_name, None)
+            cache[event_name] = candidate if callable(candidate) else None
+        return cache[event_name]
+
     def _hook_callables(self, event_name: str) -> list[HookFn]:
         """Override method (bound) first, then registered callbacks.
 
-        eventic 1.1 has no metaclass wrappers — a plain ``getattr`` is the
-        raw hook; no unwrapping is needed.
+        Reads the registered list by reference — register/unregister never
+        mutate a published list (copy-on-write above), so iteration is safe
+        without holding ``self._lock`` or copying per dispatch.
         """
-        candidate = getattr(self, event_name, None)
-        fn = candidate if callable(candidate) else None
-        with self._lock:
-            callbacks = list(self._hooks.get(event_name, ()))
-        return ([fn] if fn is not None else []) + callbacks
+        fn = self._hook_method(event_name)
+        callbacks = self._hooks.get(event_name, [])
+        if fn is None:
+            return callbacks
+        return [fn] + callbacks if callbacks else [fn]
+
+    def _has_hook(self, event_name: str) -> bool:
+        """Whether dispatching ``event_name`` would invoke anything.
+
+        Two dict probes — lets hot paths skip building event objects when
+        neither an override method nor a registered callback exists.
+        """
+        return self._hook_method(event_name) is not None or bool(
+            self._hooks.get(event_name)
+        )
 
     def _safe_call(self, name: str, *args: Any) -> None:
         """Invoke a lifecycle hook; failures are logged, never raised."""
@@ -254,7 +313,89 @@ class EventWatcher(BaseModel, ABC):
                 "auto_persist=True but watcher is not bound; state not persisted"
             )
             return
-        self._commit(state)
+        if self.persist_async:
+            self._enqueue_persist(state)
+        else:
+            self._commit(state)
+
+    # ---- async persistence ------------------------------------------------ #
+
+    def _enqueue_persist(self, state: Any) -> None:
+        """Hand one state to the persistence worker (started lazily).
+
+        The emitting thread only pays a ``queue.put``; DB latency moves off
+        the observer/handler path entirely.
+        """
+        with self._lock:
+            q = self._persist_queue
+            if q is None:
+                q = queue.SimpleQueue()
+                self._persist_queue = q
+                self._persist_thread = Thread(
+                    target=self._persist_worker,
+                    args=(q,),
+                    daemon=True,
+                    name="observantic-persist",
+                )
+                self._persist_thread.start()
+        q.put(state)
+
+    def _persist_worker(self, q: queue.SimpleQueue) -> None:
+        """Drain queued states until the stop sentinel; never dies (C-04).
+
+        States already sitting in the queue are drained into one batch (up
+        to ``persist_batch_size``) and committed together, so a burst pays
+        one persist-lock handoff instead of one per state.
+        """
+        while True:
+            state = q.get()
+            if state is _PERSIST_STOP:
+                return
+            batch = [state]
+            stopping = False
+            while len(batch) < self.persist_batch_size:
+                try:
+                    nxt = q.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _PERSIST_STOP:
+                    stopping = True
+                    break
+                batch.append(nxt)
+            self._commit_batch(batch)
+            if stopping:
+                return
+
+    def _commit_batch(self, states: list[Any]) -> None:
+        """Commit one drained batch under a single persist-lock acquisition.
+
+        eventic 1.1 has no bulk create, so each state is still its own
+        CAS'd ``create``; batching amortizes the process-wide lock handoff
+        (see ``_persist_lock``). Failures stay per-state — one bad state
+        routes to ``on_error`` without dropping the rest of the batch.
+        """
+        collection = self._collection
+        if collection is None:
+            return
+        with _persist_lock:
+            for state in states:
+                try:
+                    collection.create(state)
+                except Exception as e:
+                    logger.warning("persist failed (state not committed): %s", e)
+                    self._safe_call("on_error", e, state)
+
+    def _drain_persist_worker(self) -> None:
+        """Flush queued states and stop the worker (bounded); idempotent."""
+        with self._lock:
+            q = self._persist_queue
+            thread = self._persist_thread
+            self._persist_queue = None
+            self._persist_thread = None
+        if q is not None:
+            q.put(_PERSIST_STOP)
+        if thread is not None:
+            thread.join(timeout=5)
 
     def _commit(
         self,
@@ -285,6 +426,22 @@ class EventWatcher(BaseModel, ABC):
                 logger.warning("persist failed (state not committed): %s", e)
                 self._safe_call("on_error", e, state)
 
+    def _emit_state_safe(self, state: Any, event: Any) -> Any | None:
+        """Emit an already-built state from an observer thread; NEVER raises.
+
+        Skips the model rebuild ``_emit`` would do — for callers that already
+        hold an instance of the stream's model (e.g. the sqlite monitor's
+        per-row hook states). Persistence errors route to ``on_error`` like
+        ``_emit_safe``.
+        """
+        try:
+            if self.auto_persist:
+                self._persist(state)
+            return state
+        except Exception as e:
+            self._safe_call("on_error", e, event)
+            return None
+
     def _emit_safe(self, event: Any, **fields: Any) -> Any | None:
         """Emit from an observer thread; NEVER raises (C-04).
 
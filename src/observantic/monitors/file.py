@@ -1,9 +1,21 @@
 """
 File system monitoring mixin using watchdog.
+
+``Observer`` resolves to the native kernel backend where one exists
+(inotify on Linux, FSEvents on macOS, ReadDirectoryChangesW on Windows)
+and only degrades to polling on filesystems without event support — no
+per-interval directory scans in the common case. On Linux, bursty trees
+may need ``fs.inotify.max_user_watches`` / ``max_queued_events`` raised.
 """
 
 from __future__ import annotations
 
+import array
+import fnmatch
+import logging
+import os
+import re
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -15,14 +27,111 @@ from watchdog.events import (
     FileDeletedEvent,
     FileModifiedEvent,
     FileMovedEvent,
-    PatternMatchingEventHandler,
+    FileSystemEvent,
+    FileSystemEventHandler,
 )
 from watchdog.observers import Observer
-from watchdog.observers.api import BaseObserver
+from watchdog.observers.api import BaseObserver, ObservedWatch
 
 from ..core import EventWatcher
 from ..exceptions import ConfigurationException, WatcherException
 
+logger = logging.getLogger("observantic.file")
+
+# Throttle state is a fixed array of monotonic-ns timestamps indexed by
+# hash(path): constant memory regardless of tree size (H-19), no dict
+# resize/eviction work per event. A colliding pair of paths occasionally
+# over-throttles — acceptable, since throttling is a rate limiter, not an
+# exactness guarantee. Power of two so the slot index is a mask.
+_THROTTLE_SLOTS = 4096
+_THROTTLE_MASK = _THROTTLE_SLOTS - 1
+
+# One Observer for the whole process: each Observer owns an inotify
+# instance (bounded by fs.inotify.max_user_instances) plus an emitter
+# thread, so per-watcher Observers exhaust kernel resources at O(N)
+# watchers. All FileEventBase instances multiplex through this shared
+# instance; watches are refcounted so a watcher stopping only detaches
+# its own handler, and the observer itself stops when the last watcher
+# releases it.
+_observer_lock = threading.Lock()
+_shared_observer: BaseObserver | None = None
+_observer_refs = 0
+_watch_refs: dict[ObservedWatch, int] = {}
+
+
+def _schedule_shared(
+    handler: FileSystemEventHandler, path: str, recursive: bool
+) -> tuple[BaseObserver, ObservedWatch]:
+    """Attach a handler to the shared observer, creating it on first use."""
+    global _shared_observer, _observer_refs
+    with _observer_lock:
+        observer = _shared_observer
+        created = observer is None
+        if created:
+            observer = Observer()
+        assert observer is not None
+        watch = None
+        if not created and recursive:
+            # Consolidate overlapping subscriptions: a live recursive watch
+            # covering `path` already delivers this subtree, so attach the
+            # handler to it instead of adding kernel watches for every
+            # directory a second time. The watcher scopes events back down
+            # to its own root (see _event_matches).
+            covering = [
+                w
+                for w in _watch_refs
+                if w.is_recursive
+                and (path == w.path or path.startswith(w.path + os.sep))
+            ]
+            if covering:
+                watch = max(covering, key=lambda w: len(w.path))  # closest root
+                observer.add_handler_for_watch(handler, watch)
+        if watch is None:
+            try:
+                watch = observer.schedule(handler, path, recursive=recursive)
+                if created:
+                    observer.start()
+            except Exception:
+                if created:
+                    observer.stop()
+                raise
+        if created:
+            _shared_observer = observer
+        _observer_refs += 1
+        _watch_refs[watch] = _watch_refs.get(watch, 0) + 1
+        return observer, watch
+
+
+def _unschedule_shared(handler: FileSystemEventHandler, watch: ObservedWatch) -> None:
+    """Detach one handler; stop the observer when the last watcher leaves."""
+    global _shared_observer, _observer_refs
+    stopped: BaseObserver | None = None
+    with _observer_lock:
+        observer = _shared_observer
+        if observer is None:
+            return
+        remaining = _watch_refs.get(watch, 1) - 1
+        if remaining > 0:
+            # Another watcher still uses this exact watch — only drop our
+            # handler, never the shared kernel watch.
+            _watch_refs[watch] = remaining
+            observer.remove_handler_for_watch(handler, watch)
+        else:
+            _watch_refs.pop(watch, None)
+            try:
+                observer.unschedule(watch)
+            except KeyError:
+                pass  # already gone (observer restarted underneath us)
+        _observer_refs -= 1
+        if _observer_refs <= 0:
+            _observer_refs = 0
+            _shared_observer = None
+            _watch_refs.clear()
+            stopped = observer
+    if stopped is not None and stopped.is_alive():
+        stopped.stop()
+        stopped.join(timeout=5)  # bounded join (H-19)
+
 
 class FileRecord(BaseModel):
     """File system event record."""
@@ -56,10 +165,26 @@ class FileEventBase(EventWatcher):
     event_throttle_seconds: float = Field(
         default=0.1, description="Minimum seconds between events per file"
     )
+    modify_debounce_seconds: float = Field(
+        default=0.0,
+        description=(
+            "Coalesce modify bursts per file: emit one trailing event after "
+            "the path has been quiet this long (0 disables; editors and "
+            "build tools emit many modify events per save)"
+        ),
+    )
 
     _observer: BaseObserver | None = PrivateAttr(default=None)
+    _watch: ObservedWatch | None = PrivateAttr(default=None)
+    _handler: FileSystemEventHandler | None = PrivateAttr(default=None)
     _watch_path: str | None = PrivateAttr(default=None)
-    _last_event_times: dict[str, float] = PrivateAttr(default_factory=dict)
+    _watch_prefix: str | None = PrivateAttr(default=None)
+    _throttle_slots: array.array | None = PrivateAttr(default=None)
+    _throttle_ns: int = PrivateAttr(default=0)
+    _debounce_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _pending_modified: dict[str, threading.Timer] = PrivateAttr(default_factory=dict)
+    _pattern_re: re.Pattern[str] | None = PrivateAttr(default=None)
+    _ignore_re: re.Pattern[str] | None = PrivateAttr(default=None)
 
     # ---- state machine extension points ---------------------------------- #
 
@@ -71,23 +196,41 @@ class FileEventBase(EventWatcher):
 
     def _start_impl(self, path: str, recursive: bool = True, **kwargs: Any) -> None:
         self._watch_path = str(Path(path).resolve())
-        self._last_event_times = {}
-        self._observer = Observer()
+        self._throttle_slots = None  # re-seeded lazily; picks up config changes
+        self._pending_modified = {}
+        self._compile_patterns()
+        handler = self._create_handler()
         try:
-            self._observer.schedule(
-                self._create_handler(), self._watch_path, recursive=recursive
+            self._observer, self._watch = _schedule_shared(
+                handler, self._watch_path, recursive
             )
-            self._observer.start()
         except Exception as e:
             self._observer = None
             raise WatcherException(f"Failed to start observer: {e}") from e
+        self._handler = handler
+        # Attached to a broader ancestor watch? Then events outside our
+        # subtree arrive too and must be scoped out per event.
+        self._watch_prefix = (
+            self._watch_path + os.sep
+            if str(self._watch.path) != self._watch_path
+            else None
+        )
+        logger.debug(
+            "watching %s via %s", self._watch_path, type(self._observer).__name__
+        )
 
     def _stop_impl(self) -> None:
-        observer = self._observer
         self._observer = None
-        if observer is not None and observer.is_alive():
-            observer.stop()
-            observer.join(timeout=5)  # bounded join (H-19)
+        handler = self._handler
+        watch = self._watch
+        self._handler = None
+        self._watch = None
+        if handler is not None and watch is not None:
+            _unschedule_shared(handler, watch)
+        with self._debounce_lock:
+            for timer in self._pending_modified.values():
+                timer.cancel()
+            self._pending_modified.clear()
 
     def _default_record_model(self) -> type[Any]:
         return FileRecord
@@ -95,80 +238,176 @@ class FileEventBase(EventWatcher):
     # ---- throttling ------------------------------------------------------ #
 
     def _should_throttle(self, path: str) -> bool:
-        """True when `path` fired too recently; prunes stale entries (H-19)."""
+        """True when `path` fired too recently; fixed slot array (H-19).
+
+        One hash + one array read/write per event on the monotonic clock
+        (immune to wall-clock jumps) — no dict growth, no eviction work.
+        See ``_THROTTLE_SLOTS`` for the collision trade-off.
+        """
         if self.event_throttle_seconds <= 0:
             return False
 
-        now = time.time()
-        cutoff = now - max(60.0, self.event_throttle_seconds * 100)
-        for stale in [p for p, t in self._last_event_times.items() if t < cutoff]:
-            del self._last_event_times[stale]
-
-        last_time = self._last_event_times.get(path, 0)
-        if now - last_time < self.event_throttle_seconds:
+        slots = self._throttle_slots
+        if slots is None:
+            slots = array.array("q", bytes(8 * _THROTTLE_SLOTS))
+            self._throttle_slots = slots
+            self._throttle_ns = int(self.event_throttle_seconds * 1e9)
+        slot = hash(path) & _THROTTLE_MASK
+        now = time.monotonic_ns()
+        last = slots[slot]
+        if last and now - last < self._throttle_ns:
             return True
-        self._last_event_times[path] = now
+        slots[slot] = now
         return False
 
+    # ---- path normalization ---------------------------------------------- #
+
+    @staticmethod
+    def _event_path(raw: Any) -> str:
+        """Absolute path for a watchdog event payload, without stat calls.
+
+        The observer is scheduled on a pre-resolved root, so watchdog
+        already delivers absolute paths — ``Path(...).resolve()`` per event
+        would re-walk every ancestor with stat() for nothing. Only relative
+        paths (non-native emitters) pay the resolve.
+        """
+        path = os.fsdecode(raw) if isinstance(raw, bytes) else str(raw)
+        return path if os.path.isabs(path) else str(Path(path).resolve())
+
+    # ---- modify debouncing ----------------------------------------------- #
+
+    def _debounce_modified(self, path: str, event: FileModifiedEvent) -> None:
+        """(Re)arm the trailing-edge timer for `path` — one emit per idle window."""
+        with self._debounce_lock:
+            pending = self._pending_modified.pop(path, None)
+            if pending is not None:
+                pending.cancel()
+            timer = threading.Timer(
+                self.modify_debounce_seconds, self._flush_modified, args=(path, event)
+            )
+            timer.daemon = True
+            self._pending_modified[path] = timer
+            timer.start()
+
+    def _flush_modified(self, path: str, event: FileModifiedEvent) -> None:
+        """Emit the coalesced modify once the path has gone quiet."""
+        with self._debounce_lock:
+            self._pending_modified.pop(path, None)
+        if not self._watching:
+            return
+        self._emit_safe(
+            event,
+            path=self._event_path(path),
+            event_type="modified",
+            is_directory=False,
+        )
+        self._dispatch_hook("on_file_modified", event)
+
+    # ---- pattern matching ------------------------------------------------ #
+
+    def _compile_patterns(self) -> None:
+        """Compile watch/ignore globs into one alternation regex each.
+
+        One DFA traversal of the path per event, instead of the
+        O(patterns) ``fnmatch`` scan ``PatternMatchingEventHandler`` does.
+        """
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        patterns = self.watch_patterns or ["*"]
+        self._pattern_re = re.compile(
+            "|".join(fnmatch.translate(p) for p in patterns), flags
+        )
+        self._ignore_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.ignore_patterns), flags)
+            if self.ignore_patterns
+            else None
+        )
+
+    def _event_matches(self, event: FileSystemEvent) -> bool:
+        """Gate an event on watch scope and the precompiled regexes."""
+        paths = [str(event.src_path)]
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            paths.append(str(dest))
+        prefix = self._watch_prefix
+        if prefix is not None and not any(p.startswith(prefix) for p in paths):
+            return False  # delivered via an ancestor watch — out of scope
+        ignore_re = self._ignore_re
+        if ignore_re is not None and any(ignore_re.match(p) for p in paths):
+            return False
+        pattern_re = self._pattern_re
+        return pattern_re is None or any(pattern_re.match(p) for p in paths)
+
     # ---- watchdog handler ------------------------------------------------ #
 
-    def _create_handler(self) -> PatternMatchingEventHandler:
-        parent = self
-
-        class FileHandler(PatternMatchingEventHandler):
-            def __init__(self):
-                super().__init__(
-                    patterns=parent.watch_patterns,
-                    ignore_patterns=parent.ignore_patterns,
-                    ignore_directories=False,
-                    case_sensitive=parent.case_sensitive,
-                )
-
-            def on_created(self, event: FileCreatedEvent) -> None:  # type: ignore[override]
-                if not event.is_directory and not parent._should_throttle(
-                    str(event.src_path)
-                ):
-                    parent._emit_safe(
-                        event,
-                        path=str(Path(str(event.src_path)).resolve()),
-                        event_type="created",
-                        is_directory=event.is_directory,
-                    )
-                    parent._dispatch_hook("on_file_created", event)
-
-            def on_modified(self, event: FileModifiedEvent) -> None:  # type: ignore[override]
-                if not event.is_directory and not parent._should_throttle(
-                    str(event.src_path)
-                ):
-                    parent._emit_safe(
-                        event,
-                        path=str(Path(str(event.src_path)).resolve()),
-                        event_type="modified",
-                        is_directory=event.is_directory,
-                    )
-                    parent._dispatch_hook("on_file_modified", event)
-
-            def on_deleted(self, event: FileDeletedEvent) -> None:  # type: ignore[override]
-                if not event.is_directory:
-                    parent._emit_safe(
-                        event,
-                        path=str(Path(str(event.src_path)).resolve()),
-                        event_type="deleted",
-                        is_directory=event.is_directory,
-                    )
-                    parent._dispatch_hook("on_file_deleted", event)
-
-            def on_moved(self, event: FileMovedEvent) -> None:  # type: ignore[override]
-                if not event.is_directory and not parent._should_throttle(
-                    str(event.src_path)
-                ):
-                    parent._emit_safe(
-                        event,
-                        path=str(Path(str(event.src_path)).resolve()),
-                        event_type="moved",
-                        is_directory=event.is_directory,
-                        dest_path=str(Path(str(event.dest_path)).resolve()),
-                    )
-                    parent._dispatch_hook("on_file_moved", event)
-
-        return FileHandler()
+    def _create_handler(self) -> FileSystemEventHandler:
+        return _FileHandler(self)
+
+
+class _FileHandler(FileSystemEventHandler):
+    """Dispatches watchdog events into a :class:`FileEventBase`.
+
+    Defined once at module scope — the previous per-``start_watching``
+    closure class re-executed the class body and rebuilt every method
+    object for each watcher (and each restart).
+    """
+
+    def __init__(self, parent: FileEventBase) -> None:
+        self._parent = parent
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        if self._parent._event_matches(event):
+            super().dispatch(event)
+
+    def on_created(self, event: FileCreatedEvent) -> None:  # type: ignore[override]
+        parent = self._parent
+        if not event.is_directory and not parent._should_throttle(
+            str(event.src_path)
+        ):
+            parent._emit_safe(
+                event,
+                path=parent._event_path(event.src_path),
+                event_type="created",
+                is_directory=event.is_directory,
+            )
+            parent._dispatch_hook("on_file_created", event)
+
+    def on_modified(self, event: FileModifiedEvent) -> None:  # type: ignore[override]
+        if event.is_directory:
+            return
+        parent = self._parent
+        path = str(event.src_path)
+        if parent.modify_debounce_seconds > 0:
+            parent._debounce_modified(path, event)
+        elif not parent._should_throttle(path):
+            parent._emit_safe(
+                event,
+                path=parent._event_path(path),
+                event_type="modified",
+                is_directory=event.is_directory,
+            )
+            parent._dispatch_hook("on_file_modified", event)
+
+    def on_deleted(self, event: FileDeletedEvent) -> None:  # type: ignore[override]
+        parent = self._parent
+        if not event.is_directory:
+            parent._emit_safe(
+                event,
+                path=parent._event_path(event.src_path),
+                event_type="deleted",
+                is_directory=event.is_directory,
+            )
+            parent._dispatch_hook("on_file_deleted", event)
+
+    def on_moved(self, event: FileMovedEvent) -> None:  # type: ignore[override]
+        parent = self._parent
+        if not event.is_directory and not parent._should_throttle(
+            str(event.src_path)
+        ):
+            parent._emit_safe(
+                event,
+                path=parent._event_path(event.src_path),
+                event_type="moved",
+                is_directory=event.is_directory,
+                dest_path=parent._event_path(event.dest_path),
+            )
+            parent._dispatch_hook("on_file_moved", event)
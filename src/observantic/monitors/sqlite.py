@@ -5,6 +5,12 @@ Change detection is snapshot-based: per table we keep ``{rowid: cells}`` and
 diff it against a fresh read on every check. This correctly reports inserts,
 updates, deletes and (with ``track_schema_changes``) DDL — unlike the old
 rowid-checkpoint approach (C-01, H-15).
+
+Checks are driven by a background poll thread gated on ``PRAGMA
+data_version`` — one pragma read per tick that bumps whenever another
+connection commits (including WAL-mode writes before checkpoint, which a
+filesystem watch on the main database file misses). Idle databases cost a
+pragma read per interval, never a diff, and no inotify instance is held.
 """
 
 from __future__ import annotations
@@ -18,13 +24,10 @@ from typing import Any, Literal
 
 from eventic import Stream
 from pydantic import BaseModel, Field, PrivateAttr
-from watchdog.events import FileModifiedEvent, FileSystemEventHandler
-from watchdog.observers import Observer
-from watchdog.observers.api import BaseObserver
 
 from .._eventic import persist_row
 from ..core import EventWatcher
-from ..exceptions import ConfigurationException, WatcherException
+from ..exceptions import ConfigurationException
 
 logger = logging.getLogger("observantic.sqlite")
 
@@ -62,7 +65,10 @@ class SQLiteEventBase(EventWatcher):
 
     poll_interval_seconds: float = Field(
         default=1.0,
-        description="Background poll interval; 0 disables the poll thread",
+        description=(
+            "Change-detection interval (PRAGMA data_version gate per tick); "
+            "0 disables automatic detection"
+        ),
     )
     track_schema_changes: bool = Field(
         default=True, description="Emit SchemaChange events on DDL"
@@ -85,19 +91,35 @@ class SQLiteEventBase(EventWatcher):
         ),
     )
 
-    _observer: BaseObserver | None = PrivateAttr(default=None)
     _poll_thread: threading.Thread | None = PrivateAttr(default=None)
     _check_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _wake: threading.Event = PrivateAttr(default_factory=threading.Event)
+    _last_data_version: int | None = PrivateAttr(default=None)
     _db_path: str | None = PrivateAttr(default=None)
+    _conn: sqlite3.Connection | None = PrivateAttr(default=None)
     _snapshots: dict[str, dict[Any, tuple[Any, ...]]] = PrivateAttr(
         default_factory=dict
     )
     _schema: dict[str, str] = PrivateAttr(default_factory=dict)
+    _table_sql: dict[str, tuple[str, str]] = PrivateAttr(default_factory=dict)
     _pending_inserts: list[DatabaseRow] = PrivateAttr(default_factory=list)
 
     # ---- state machine extension points ---------------------------------- #
 
     def _validate_start(self, path: str) -> None:
+        if path.startswith("file:"):
+            # SQLite URI (e.g. file:name?mode=memory&cache=shared) — nothing
+            # on disk to stat, so prove it opens instead (fail fast, H-10).
+            try:
+                sqlite3.connect(
+                    path, uri=True, timeout=self.db_connect_timeout_seconds
+                ).close()
+            except sqlite3.Error as e:
+                raise ConfigurationException(
+                    f"Cannot open database URI: {path} ({e})"
+                ) from e
+            self._db_path = path
+            return
         resolved = Path(path).resolve()
         if not resolved.exists():
             raise ConfigurationException(f"Database does not exist: {path}")
@@ -109,40 +131,66 @@ class SQLiteEventBase(EventWatcher):
         self._snapshots = {}
         self._schema = {}
         self._pending_inserts = []
-        self._refresh_snapshot()  # seeds _snapshots + _schema
-
-        assert self._db_path is not None
-        self._observer = Observer()
+        self._table_sql = {}
+        self._conn = self._connect()  # one connection for the whole watch
         try:
-            self._observer.schedule(
-                self._create_handler(),
-                str(Path(self._db_path).parent),
-                recursive=False,
-            )
-            self._observer.start()
-        except Exception as e:
-            self._observer = None
-            raise WatcherException(f"Failed to start database observer: {e}") from e
+            self._refresh_snapshot()  # seeds _snapshots + _schema
+            self._last_data_version = self._read_data_version()
+        except Exception:
+            self._close_conn()
+            raise
 
         if self.poll_interval_seconds > 0:
+            self._wake.clear()
             self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
             self._poll_thread.start()
 
     def _stop_impl(self) -> None:
-        observer = self._observer
-        self._observer = None
-        if observer is not None and observer.is_alive():
-            observer.stop()
-            observer.join(timeout=5)  # bounded join (H-19)
-
         poll = self._poll_thread
         self._poll_thread = None
+        self._wake.set()  # release a sleeping poll loop immediately
         if poll is not None:
             poll.join(timeout=5)
 
+        with self._check_lock:  # no check mid-close
+            self._close_conn()
+
     def _default_record_model(self) -> type[Any]:
         return DatabaseRow
 
+    # ---- connection ------------------------------------------------------- #
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived monitoring connection.
+
+        One connection per watch instead of one per check keeps SQLite's
+        page cache hot and drops the connect/close syscalls from every
+        poll. Only per-connection, read-side PRAGMAs are applied — a
+        monitor must never mutate the observed database (journal_mode=WAL
+        would persist into the file), and busy handling stays on the
+        configured ``db_connect_timeout_seconds``.
+        """
+        assert self._db_path is not None
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self.db_connect_timeout_seconds,
+            check_same_thread=False,  # poll + handler threads; _check_lock guards
+            uri=self._db_path.startswith("file:"),
+        )
+        conn.execute("PRAGMA cache_size=-64000")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # read via mmap where possible
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    def _close_conn(self) -> None:
+        conn = self._conn
+        self._conn = None
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass  # already broken — nothing to release
+
     # ---- keyed-aggregate persistence -------------------------------------- #
 
     def _persist(self, state: Any) -> None:
@@ -163,32 +211,54 @@ class SQLiteEventBase(EventWatcher):
     # ---- polling --------------------------------------------------------- #
 
     def _poll_loop(self) -> None:
+        wake = self._wake
         while self._watching:
-            time.sleep(self.poll_interval_seconds)
+            wake.wait(self.poll_interval_seconds)  # set by stop_watching
+            if not self._watching:
+                return
             try:
-                self._check_for_changes()
+                if self._data_version_changed():
+                    self._check_for_changes()
             except Exception as e:  # never escape the poll thread (C-04)
                 self._safe_call("on_error", e, self._db_path)
 
+    def _data_version_changed(self) -> bool:
+        """True when another connection has committed since the last tick.
+
+        ``PRAGMA data_version`` bumps on any foreign commit — including
+        WAL-mode writes before checkpoint, which a filesystem watch on the
+        main database file misses. One pragma read gates the full snapshot
+        diff, so idle databases never pay one.
+        """
+        with self._check_lock:
+            conn = self._conn
+            if conn is None:
+                return False
+            version = conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self._last_data_version
+        self._last_data_version = version
+        return changed
+
     # ---- change detection ------------------------------------------------ #
 
     def _check_for_changes(self) -> None:
         if not self._db_path:
             return
         with self._check_lock:
+            conn = self._conn
+            if conn is None:
+                return  # stopped mid-flight
             self._pending_inserts = []
-            conn = sqlite3.connect(
-                self._db_path, timeout=self.db_connect_timeout_seconds
-            )
             try:
                 with conn:
-                    self._check_schema(conn)  # DDL events (H-16)
-                    for table in self._list_rowid_tables(conn):
+                    # One sqlite_master read serves both the DDL diff and
+                    # the table list — not one query per concern per check.
+                    now_schema = self._read_schema(conn)
+                    self._check_schema(now_schema)  # DDL events (H-16)
+                    for table in sorted(now_schema):
                         self._diff_table(conn, table)  # row events
             except sqlite3.Error as e:
-                self._safe_call("on_error", e, self._db_path)  # always close (H-19)
-            finally:
-                conn.close()
+                self._safe_call("on_error", e, self._db_path)
             if self._pending_inserts:
                 self._dispatch_hook(
                     "on_data_changed", self._db_path, list(self._pending_inserts)
@@ -196,24 +266,21 @@ class SQLiteEventBase(EventWatcher):
 
     def _refresh_snapshot(self) -> None:
         """Take a fresh snapshot of every rowid table + sqlite_master."""
-        if not self._db_path:
+        conn = self._conn
+        if conn is None:
             return
-        conn = sqlite3.connect(self._db_path, timeout=self.db_connect_timeout_seconds)
-        try:
-            with conn:
-                self._schema = self._read_schema(conn)
-                for table in self._list_rowid_tables(conn):
-                    result = self._read_table(conn, table)
-                    if result is not None:
-                        _, snapshot = result
-                        self._snapshots[table] = snapshot
-        finally:
-            conn.close()
-
-    def _check_schema(self, conn: sqlite3.Connection) -> None:
+        with conn:
+            self._schema = self._read_schema(conn)
+            for table in sorted(self._schema):
+                result = self._read_table(conn, table)
+                if result is not None:
+                    _, snapshot = result
+                    self._snapshots[table] = snapshot
+
+    def _check_schema(self, now_schema: dict[str, str]) -> None:
         if not self.track_schema_changes:
+            self._schema = now_schema
             return
-        now_schema = self._read_schema(conn)
         if not self._schema or now_schema == self._schema:
             self._schema = now_schema
             return
@@ -240,14 +307,15 @@ class SQLiteEventBase(EventWatcher):
             return  # oversized or not rowid-compatible — skip
         cols, now = result
         old = self._snapshots.setdefault(table, {})
+        ts = time.time()  # one clock read per diff, shared by its rows
 
         for rid, cells in now.items():
             if rid not in old:
-                self._emit_row(table, rid, cols, cells, "inserted")
+                self._emit_row(table, rid, cols, cells, "inserted", ts)
             elif old[rid] != cells:
-                self._emit_row(table, rid, cols, cells, "updated")
+                self._emit_row(table, rid, cols, cells, "updated", ts)
         for rid in old.keys() - now.keys():
-            self._emit_row(table, rid, cols, None, "deleted")
+            self._emit_row(table, rid, cols, None, "deleted", ts)
 
         self._snapshots[table] = now
 
@@ -258,18 +326,31 @@ class SQLiteEventBase(EventWatcher):
         cols: list[str],
         cells: tuple[Any, ...] | None,
         operation: Literal["inserted", "updated", "deleted"],
+        ts: float,
     ) -> None:
         row_data = dict(zip(cols, cells, strict=False)) if cells is not None else None
-        row = DatabaseRow(
-            table_name=table, row_data=row_data, row_id=rid, operation=operation
-        )
-        self._emit_safe(
-            row,
+        # Trusted internal data (straight out of sqlite3) — model_construct
+        # skips a full pydantic validation pass per changed row.
+        row = DatabaseRow.model_construct(
             table_name=table,
             row_data=row_data,
             row_id=rid,
             operation=operation,
+            timestamp=ts,
         )
+        model = self.stream.model if self.stream is not None else DatabaseRow
+        if model is DatabaseRow:
+            # The hook row already *is* the stream state — don't validate a
+            # second identical instance per change.
+            self._emit_state_safe(row, row)
+        else:
+            self._emit_safe(
+                row,
+                table_name=table,
+                row_data=row_data,
+                row_id=rid,
+                operation=operation,
+            )
         hook = {
             "inserted": "on_row_inserted",
             "updated": "on_row_updated",
@@ -281,14 +362,6 @@ class SQLiteEventBase(EventWatcher):
 
     # ---- sqlite helpers -------------------------------------------------- #
 
-    @staticmethod
-    def _list_rowid_tables(conn: sqlite3.Connection) -> list[str]:
-        rows = conn.execute(
-            "SELECT name FROM sqlite_master "
-            "WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
-        ).fetchall()
-        return [r[0] for r in rows]
-
     @staticmethod
     def _read_schema(conn: sqlite3.Connection) -> dict[str, str]:
         rows = conn.execute(
@@ -305,9 +378,17 @@ class SQLiteEventBase(EventWatcher):
     def _read_table(
         self, conn: sqlite3.Connection, table: str
     ) -> tuple[list[str], dict[Any, tuple[Any, ...]]] | None:
-        qname = self._quote(table)
+        # SQL text is built once per table: sqlite3 keys its statement
+        # cache on the exact string, so a stable object reuses the
+        # compiled plan instead of re-parsing per check.
+        sqls = self._table_sql.get(table)
+        if sqls is None:
+            qname = self._quote(table)
+            sqls = (f"SELECT COUNT(*) FROM {qname}", f"SELECT rowid, * FROM {qname}")
+            self._table_sql[table] = sqls
+        count_sql, select_sql = sqls
         if self.max_table_rows > 0:
-            count = conn.execute(f"SELECT COUNT(*) FROM {qname}").fetchone()[0]
+            count = conn.execute(count_sql).fetchone()[0]
             if count > self.max_table_rows:
                 logger.warning(
                     "table %s has %d rows; skipping snapshot (max_table_rows=%d)",
@@ -317,27 +398,25 @@ class SQLiteEventBase(EventWatcher):
                 )
                 return None
         try:
-            cur = conn.execute(f"SELECT rowid, * FROM {qname}")
+            cur = conn.execute(select_sql)
         except sqlite3.OperationalError:
             return None  # WITHOUT ROWID or otherwise not rowid-compatible
         # Drop the leading rowid column: snapshot values are row[1:].
         cols = [d[0] for d in cur.description][1:]
-        snapshot = {row[0]: tuple(row[1:]) for row in cur.fetchall()}
+        # fetchmany keeps peak memory bounded on large catch-up reads,
+        # instead of materializing the whole table twice via fetchall.
+        cur.arraysize = 1000  # batch size for each fetchmany round-trip
+        snapshot: dict[Any, tuple[Any, ...]] = {}
+        rows = cur.fetchmany()
+        while rows:
+            for row in rows:
+                # rows are already tuples; the slice *is* the cell tuple
+                snapshot[row[0]] = row[1:]
+            rows = cur.fetchmany()
         return cols, snapshot
 
-    # ---- watchdog handler ------------------------------------------------ #
-
-    def _create_handler(self) -> FileSystemEventHandler:
-        parent = self
-
-        class SQLiteHandler(FileSystemEventHandler):
-            def on_modified(self, event: FileModifiedEvent) -> None:  # type: ignore[override]
-                if not event.is_directory:
-                    if str(Path(str(event.src_path)).resolve()) == parent._db_path:
-                        try:
-                            parent._check_for_changes()
-                        except Exception as e:
-                            # never kill the observer thread (C-04)
-                            parent._safe_call("on_error", e, event)
-
-        return SQLiteHandler()
+    def _read_data_version(self) -> int | None:
+        conn = self._conn
+        if conn is None:
+            return None
+        return conn.execute("PRAGMA data_version").fetchone()[0]
@@ -1,7 +1,7 @@
 """
 HTTP webhook monitoring mixin.
 
-Hardened server: ThreadingHTTPServer with daemon threads, bounded body reads
+Hardened server: HTTPServer over a bounded worker pool, bounded body reads
 (Content-Length validation + size cap), socket timeouts, tracked connections
 for a bounded shutdown, constant-time auth comparison, and no exception
 leakage to clients (C-05, C-06, H-11, H-17).
@@ -12,12 +12,15 @@ from __future__ import annotations
 import hmac
 import json
 import logging
+import os
+import selectors
 import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any
 from urllib.parse import parse_qsl, urlparse
 
@@ -27,10 +30,41 @@ from pydantic import BaseModel, Field, PrivateAttr
 from ..core import EventWatcher
 from ..exceptions import ConfigurationException, WatcherException
 
+try:  # optional: parses/serializes bytes directly, several times faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("observantic.webhook")
 
+# The 200 body never varies — serialize it once, not per request.
+_OK_RESPONSE = b'{"status": "ok"}'
+
+# The entire success response (status line + headers + body) as one bytes
+# literal: the hot path issues a single write and skips send_response's
+# per-request Date header formatting. Safe to hardwire because the body is
+# constant and HTTP/1.1 keep-alive is implied by the version.
+_OK_FRAME = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_OK_RESPONSE)).encode("ascii") + b"\r\n"
+    b"\r\n" + _OK_RESPONSE
+)
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
-@dataclass
+def _json_dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@dataclass(slots=True)
 class WebhookEvent:
     """Represents an incoming webhook event."""
 
@@ -39,9 +73,19 @@ class WebhookEvent:
     headers: dict[str, str]
     body: bytes | str | dict
     query_params: dict[str, str]
-    timestamp: datetime
+    timestamp_ns: int
     source_ip: str
 
+    @property
+    def timestamp(self) -> datetime:
+        """Arrival time as a datetime, materialized on access.
+
+        Capture stores only ``time.time_ns()`` — building a datetime (tz
+        lookup + allocation) per request would charge every webhook for a
+        value most hooks never read.
+        """
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
 
 class WebhookRecord(BaseModel):
     """HTTP webhook event record."""
@@ -65,15 +109,6 @@ class _ConnectionTrackingMixIn:
     _connections: set[socket.socket] = set()
     _conn_lock: threading.Lock = threading.Lock()
 
-    def process_request(self, request, client_address):
-        with self._conn_lock:
-            self._connections.add(request)
-        try:
-            super().process_request(request, client_address)
-        finally:
-            with self._conn_lock:
-                self._connections.discard(request)
-
     def close_all_connections(self):
         with self._conn_lock:
             for sock in list(self._connections):
@@ -88,9 +123,312 @@ class _ConnectionTrackingMixIn:
             self._connections.clear()
 
 
-class _WebhookServer(_ConnectionTrackingMixIn, ThreadingHTTPServer):
-    daemon_threads = True
+class _WebhookServer(_ConnectionTrackingMixIn, HTTPServer):
     allow_reuse_address = True
+    request_queue_size = 128  # absorb arrival bursts in the kernel backlog
+
+    def __init__(self, server_address, handler_class, watcher) -> None:
+        super().__init__(server_address, handler_class)
+        # Per-start snapshot read by the module-scope handler — structural
+        # config only. Routing (paths, methods) and the stream model are
+        # fixed once the server is bound, so they are hoisted off the
+        # pydantic model into frozensets/plain attributes. Tunables that
+        # callers may adjust on a running watcher (max_body_bytes, auth,
+        # parse_json_body) are deliberately NOT snapshotted; the handler
+        # reads them live from ``parent``.
+        self.parent = watcher
+        self.allowed_paths = frozenset(watcher.webhook_paths)
+        self.allowed_methods = frozenset(watcher.allowed_methods)
+        # Only the default record declares a timestamp field; custom stream
+        # models keep the Appendix A emit contract (no timestamp kwarg) and
+        # fill their own defaults.
+        model = watcher.stream.model if watcher.stream is not None else WebhookRecord
+        self.stamp_record = model is WebhookRecord
+        # Fixed worker pool instead of ThreadingMixIn's thread per
+        # connection: no stack allocation per request, and concurrency is
+        # bounded at the dispatch point rather than by a semaphore inside
+        # already-spawned threads.
+        self._pool = ThreadPoolExecutor(
+            max_workers=watcher.max_concurrent_requests,
+            thread_name_prefix="observantic-webhook",
+        )
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._shutdown_requested = False
+        self._serve_done = threading.Event()
+        self._serve_done.set()
+
+    def process_request(self, request, client_address):
+        with self._conn_lock:
+            self._connections.add(request)
+        self._pool.submit(self._process_in_worker, request, client_address)
+
+    def _process_in_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            with self._conn_lock:
+                self._connections.discard(request)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Selector loop with a wakeup pipe instead of the stdlib poll tick.
+
+        ``BaseServer.serve_forever`` re-checks its shutdown flag every
+        ``poll_interval`` (0.5s), so ``shutdown()`` can block up to half a
+        second doing nothing. Here the select blocks indefinitely on the
+        listening socket *and* a pipe that ``shutdown()`` writes to — stop
+        latency drops to the cost of one pipe write (H-19).
+        """
+        self._serve_done.clear()
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                selector.register(self._wakeup_r, selectors.EVENT_READ)
+                while not self._shutdown_requested:
+                    for key, _ in selector.select():
+                        if key.fd == self._wakeup_r:
+                            os.read(self._wakeup_r, 1024)  # drain the wakeup
+                        elif not self._shutdown_requested:
+                            self._handle_request_noblock()
+                    self.service_actions()
+        finally:
+            self._serve_done.set()
+
+    def shutdown(self) -> None:
+        self._shutdown_requested = True
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except OSError:
+            pass  # pipe already closed — loop is not running
+        self._serve_done.wait()
+
+    def server_close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        super().server_close()
+        for fd in (self._wakeup_r, self._wakeup_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Request handler, defined once at module scope.
+
+    Per-watcher config lives on the ``_WebhookServer`` snapshot (see its
+    ``__init__``) — the class body, its methods, and their code objects are
+    built at import time rather than on every ``start_watching()``.
+    """
+
+    timeout = 30  # socket read timeout → idle clients reaped (C-05)
+    keepalive_idle_timeout = 5  # idle keep-alive must not pin a pool worker
+    protocol_version = "HTTP/1.1"
+    # 16 KiB read buffering: a header block plus a typical JSON body
+    # arrives in one recv instead of several buffer refills.
+    rbufsize = 16384
+
+    def do_GET(self):
+        self._handle_request("GET")
+
+    def do_POST(self):
+        self._handle_request("POST")
+
+    def do_PUT(self):
+        self._handle_request("PUT")
+
+    def handle(self) -> None:
+        """Keep-alive loop with a short idle window; no stdlib tracebacks.
+
+        Two departures from ``BaseHTTPRequestHandler.handle``:
+
+        * After the first request the socket timeout drops to
+          ``keepalive_idle_timeout`` — with a fixed worker pool (chunk3-7)
+          an idle keep-alive connection pins a worker, so campers get
+          seconds to speak again, not the full request timeout (C-05).
+        * An abrupt client close while reading the next request line
+          raises inside socketserver's thread wrapper and prints a
+          traceback; catch and log it instead (H-11).
+        """
+        self.close_connection = True  # stdlib default until parse says otherwise
+        try:
+            self.handle_one_request()
+            while not self.close_connection:
+                self.connection.settimeout(self.keepalive_idle_timeout)
+                self.handle_one_request()
+        except (ConnectionError, BrokenPipeError, TimeoutError) as e:
+            logger.debug("webhook connection closed: %s", e)
+
+    def _handle_request(self, method: str) -> None:
+        server = self.server
+        parent = server.parent
+        try:
+            if method not in server.allowed_methods:
+                self._send_json(405, {"error": "method not allowed"})
+                return
+
+            parsed_url = urlparse(self.path)
+            path = parsed_url.path
+            if path not in server.allowed_paths:
+                self._send_json(404, {"error": "not found"})
+                return
+
+            if not self._authorized():
+                self._send_json(401, {"error": "unauthorized"})
+                return
+
+            status, body = self._read_body()
+            if status is not None:
+                message = "too large" if status == 413 else "bad request"
+                self._send_json(status, {"error": message})
+                return
+
+            parsed_body = self._parse_body(body)
+            if parsed_url.query:
+                try:
+                    query_params = dict(
+                        parse_qsl(
+                            parsed_url.query,
+                            keep_blank_values=True,
+                            max_num_fields=256,  # parse-cost cap (C-06)
+                        )
+                    )
+                except ValueError:
+                    self._send_json(400, {"error": "bad request"})
+                    return
+            else:
+                # Typical webhook POSTs carry no query string.
+                query_params = {}
+            # One C-level copy out of the email.message mapping; the
+            # plain dict iterates fast during serialization downstream.
+            headers = dict(self.headers.items())
+
+            # One clock read stamps both the persisted record and the
+            # hook event — they describe the same arrival.
+            now_ns = time.time_ns()
+
+            if server.stamp_record:
+                parent._emit(
+                    path=path,
+                    method=method,
+                    headers=headers,
+                    body=parsed_body,
+                    timestamp=now_ns / 1e9,
+                    source_ip=self.client_address[0],
+                )
+            else:
+                parent._emit(
+                    path=path,
+                    method=method,
+                    headers=headers,
+                    body=parsed_body,
+                    source_ip=self.client_address[0],
+                )
+
+            if parent._has_hook("on_webhook_received"):
+                event = WebhookEvent(
+                    path=path,
+                    method=method,
+                    headers=headers,
+                    body=parsed_body,
+                    query_params=query_params,
+                    timestamp_ns=now_ns,
+                    source_ip=self.client_address[0],
+                )
+                error = parent._dispatch_hook("on_webhook_received", event)
+            else:
+                # Persistence-only deployment: no consumer for the
+                # event object, so skip building it.
+                error = None
+            if error is not None:
+                # Generic 500 — real exception already logged via
+                # on_error (H-11).
+                self._send_json(500, {"error": "internal"})
+            elif self.close_connection:
+                # Client asked for Connection: close — let the stdlib
+                # machinery answer so the directive is honored.
+                self._send_bytes(200, _OK_RESPONSE)
+            else:
+                self.log_request(200)
+                self.wfile.write(_OK_FRAME)
+        except (ConnectionError, BrokenPipeError, TimeoutError):
+            logger.debug(
+                "webhook client disconnected during %s %s", method, self.path
+            )
+        except OSError:  # TimeoutError is an OSError subclass
+            logger.debug("webhook socket error during %s %s", method, self.path)
+        except Exception:
+            logger.exception("webhook handler error on %s %s", method, self.path)
+            try:
+                self._send_json(500, {"error": "internal"})
+            except Exception:
+                pass
+
+    def _read_body(self) -> tuple[int | None, bytes]:
+        """Strict, capped Content-Length handling (C-06)."""
+        raw = self.headers.get("Content-Length")
+        if raw is None:
+            return None, b""  # explicit: no body, no silent read
+        try:
+            length = int(raw)
+        except ValueError:
+            return 400, b""  # invalid header → 400 (was: crash)
+        if length < 0:
+            return 400, b""
+        if length > self.server.parent.max_body_bytes:
+            return 413, b""  # too large → 413, no read
+        data = self.rfile.read(length)
+        if len(data) < length:
+            # Client sent FIN mid-body. With pool dispatch the partial body
+            # and the close are often already in the kernel buffer, so read()
+            # returns short instead of raising — surface it as the disconnect
+            # it is rather than emitting a truncated event with a 200.
+            raise ConnectionError("client disconnected mid-body")
+        return None, data
+
+    def _parse_body(self, body: bytes) -> bytes | str | dict:
+        if not body:
+            return b""
+        if self.server.parent.parse_json_body:
+            content_type = self.headers.get("Content-Type", "")
+            if "application/json" in content_type:
+                try:
+                    # Parses the bytes directly — no intermediate
+                    # str copy of the body.
+                    return _json_loads(body)
+                except ValueError:  # JSONDecodeError + bad UTF-8
+                    return body.decode("utf-8", errors="ignore")
+            try:
+                return body.decode("utf-8")
+            except UnicodeDecodeError:
+                return body
+        return body
+
+    def _authorized(self) -> bool:
+        parent = self.server.parent
+        header = parent.require_auth_header
+        if not header:
+            return True
+        got = self.headers.get(header, "")
+        # Header values arrive latin-1 decoded (RFC 9110 via http.server);
+        # re-encoding is lossless and keeps the constant-time comparison
+        # bytes-vs-bytes, so a non-ASCII presented value can never raise.
+        expected = (parent.require_auth_value or "").encode("utf-8")
+        return hmac.compare_digest(got.encode("latin-1"), expected)
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        self._send_bytes(status, _json_dumps(payload))
+
+    def _send_bytes(self, status: int, data: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args):
+        logger.info("%s - %s", self.address_string(), format % args)
 
 
 class WebhookEventBase(EventWatcher):
@@ -118,6 +456,13 @@ class WebhookEventBase(EventWatcher):
     allowed_methods: list[str] = Field(
         default=["POST", "PUT"], description="HTTP methods accepted as webhooks"
     )
+    max_concurrent_requests: int = Field(
+        default=64,
+        description=(
+            "Size of the worker thread pool; excess connections queue for a "
+            "worker instead of stampeding hooks and persistence"
+        ),
+    )
 
     _server: _WebhookServer | None = PrivateAttr(default=None)
     _server_thread: threading.Thread | None = PrivateAttr(default=None)
@@ -138,9 +483,10 @@ class WebhookEventBase(EventWatcher):
             )
 
     def _start_impl(self, path: str | None = None, **kwargs: Any) -> None:
-        handler_class = self._create_handler_class()
         try:
-            self._server = _WebhookServer((self.host, self.port), handler_class)
+            self._server = _WebhookServer(
+                (self.host, self.port), _WebhookHandler, self
+            )
         except Exception as e:
             raise WatcherException(f"Failed to start webhook server: {e}") from e
         self._server_thread = threading.Thread(
@@ -163,151 +509,3 @@ class WebhookEventBase(EventWatcher):
     def _default_record_model(self) -> type[Any]:
         return WebhookRecord
 
-    # ---- handler --------------------------------------------------------- #
-
-    def _create_handler_class(self):
-        parent = self
-
-        class WebhookHandler(BaseHTTPRequestHandler):
-            timeout = 30  # socket read timeout → idle clients reaped (C-05)
-            protocol_version = "HTTP/1.1"
-
-            def do_GET(self):
-                self._handle_request("GET")
-
-            def do_POST(self):
-                self._handle_request("POST")
-
-            def do_PUT(self):
-                self._handle_request("PUT")
-
-            def handle(self) -> None:
-                """Suppress stdlib tracebacks on keep-alive disconnects (H-11).
-
-                ``BaseHTTPRequestHandler.handle`` reads the *next* request line
-                after a response; an abrupt client close there raises inside
-                socketserver's thread wrapper and prints a traceback. Catch and
-                log it instead.
-                """
-                try:
-                    super().handle()
-                except (ConnectionError, BrokenPipeError, TimeoutError) as e:
-                    logger.debug("webhook connection closed: %s", e)
-
-            def _handle_request(self, method: str) -> None:
-                try:
-                    if method not in parent.allowed_methods:
-                        self._send_json(405, {"error": "method not allowed"})
-                        return
-
-                    parsed_url = urlparse(self.path)
-                    path = parsed_url.path
-                    if path not in parent.webhook_paths:
-                        self._send_json(404, {"error": "not found"})
-                        return
-
-                    if not self._authorized():
-                        self._send_json(401, {"error": "unauthorized"})
-                        return
-
-                    status, body = self._read_body()
-                    if status is not None:
-                        message = "too large" if status == 413 else "bad request"
-                        self._send_json(status, {"error": message})
-                        return
-
-                    parsed_body = self._parse_body(body)
-                    query_params = dict(
-                        parse_qsl(parsed_url.query, keep_blank_values=True)
-                    )
-                    headers = {k: v for k, v in self.headers.items()}
-
-                    event = WebhookEvent(
-                        path=path,
-                        method=method,
-                        headers=headers,
-                        body=parsed_body,
-                        query_params=query_params,
-                        timestamp=datetime.now(),
-                        source_ip=self.client_address[0],
-                    )
-
-                    parent._emit(
-                        path=path,
-                        method=method,
-                        headers=headers,
-                        body=parsed_body,
-                        source_ip=self.client_address[0],
-                    )
-
-                    error = parent._dispatch_hook("on_webhook_received", event)
-                    if error is not None:
-                        # Generic 500 — real exception already logged via
-                        # on_error (H-11).
-                        self._send_json(500, {"error": "internal"})
-                    else:
-                        self._send_json(200, {"status": "ok"})
-                except (ConnectionError, BrokenPipeError, TimeoutError):
-                    logger.debug(
-                        "webhook client disconnected during %s %s", method, self.path
-                    )
-                except OSError:  # TimeoutError is an OSError subclass
-                    logger.debug("webhook socket error during %s %s", method, self.path)
-                except Exception:
-                    logger.exception(
-                        "webhook handler error on %s %s", method, self.path
-                    )
-                    try:
-                        self._send_json(500, {"error": "internal"})
-                    except Exception:
-                        pass
-
-            def _read_body(self) -> tuple[int | None, bytes]:
-                """Strict, capped Content-Length handling (C-06)."""
-                raw = self.headers.get("Content-Length")
-                if raw is None:
-                    return None, b""  # explicit: no body, no silent read
-                try:
-                    length = int(raw)
-                except ValueError:
-                    return 400, b""  # invalid header → 400 (was: crash)
-                if length < 0:
-                    return 400, b""
-                if length > parent.max_body_bytes:
-                    return 413, b""  # too large → 413, no read
-                return None, self.rfile.read(length)
-
-            def _parse_body(self, body: bytes) -> bytes | str | dict:
-                if not body:
-                    return b""
-                if parent.parse_json_body:
-                    content_type = self.headers.get("Content-Type", "")
-                    if "application/json" in content_type:
-                        try:
-                            return json.loads(body.decode("utf-8"))
-                        except (json.JSONDecodeError, UnicodeDecodeError):
-                            return body.decode("utf-8", errors="ignore")
-                    try:
-                        return body.decode("utf-8")
-                    except UnicodeDecodeError:
-                        return body
-                return body
-
-            def _authorized(self) -> bool:
-                if not parent.require_auth_header:
-                    return True
-                got = self.headers.get(parent.require_auth_header, "")
-                return hmac.compare_digest(got, parent.require_auth_value or "")
-
-            def _send_json(self, status: int, payload: dict) -> None:
-                data = json.dumps(payload).encode("utf-8")
-                self.send_response(status)
-                self.send_header("Content-Type", "application/json")
-                self.send_header("Content-Length", str(len(data)))
-                self.end_headers()
-                self.wfile.write(data)
-
-            def log_message(self, format: str, *args):
-                logger.info("%s - %s", self.address_string(), format % args)
-
-        return WebhookHandler
@@ -195,6 +195,21 @@ def test_auto_persist_commits_create_to_store():
         store.close()
 
 
+def test_persist_async_commits_from_worker_and_drains_on_stop():
+    store = SQLite(":memory:")
+    try:
+        runtime = App(id="t", streams=[PROBE_STREAM]).bind(store)
+        w = EmittingWatcher(auto_persist=True, persist_async=True)
+        w.bind(runtime)
+        w.start_watching("ignored")
+        for i in range(20):
+            w._emit(path=f"/p{i}", event_type="created", is_directory=False)
+        w.stop_watching()  # drains the worker queue before returning
+        assert len(runtime[PROBE_STREAM].where(limit=1000).items) == 20
+    finally:
+        store.close()
+
+
 def test_emit_without_autopersist_does_not_persist():
     store = SQLite(":memory:")
     try:
@@ -128,17 +128,88 @@ def test_throttle_coalesces_bursts(tmp_path):
         w.stop_watching()
 
 
-def test_throttle_map_pruned(tmp_path):
-    """Stale throttle entries must be pruned so the map cannot grow (H-19)."""
-    w = FileEventBase(event_throttle_seconds=0.01)
-    # Simulate: fire old entries by writing directly into the private map
-    import time as _t
-
-    w._last_event_times["stale1"] = _t.time() - 1000
-    w._last_event_times["stale2"] = _t.time() - 1000
-    w._should_throttle("fresh")
-    assert "stale1" not in w._last_event_times
-    assert "stale2" not in w._last_event_times
+def test_debounce_coalesces_modify_burst_to_one_event(tmp_path):
+    events = []
+
+    class W(FileEventBase):
+        def on_file_modified(self, event):
+            events.append(event.src_path)
+
+    w = W(modify_debounce_seconds=0.3, event_throttle_seconds=0)
+    w.start_watching(str(tmp_path))
+    try:
+        f = tmp_path / "busy.txt"
+        f.write_text("1")
+        for _ in range(5):
+            time.sleep(0.05)
+            f.write_text("x")
+        # Burst finished; exactly one trailing modify fires after the window.
+        assert wait_for(lambda: len(events) >= 1)
+        time.sleep(0.5)
+        assert len(events) == 1, f"expected one coalesced modify, got {len(events)}"
+    finally:
+        w.stop_watching()
+
+
+def test_debounce_pending_timers_cancelled_on_stop(tmp_path):
+    events = []
+
+    class W(FileEventBase):
+        def on_file_modified(self, event):
+            events.append(event.src_path)
+
+    w = W(modify_debounce_seconds=5.0, event_throttle_seconds=0)
+    w.start_watching(str(tmp_path))
+    (tmp_path / "late.txt").write_text("x")
+    time.sleep(0.3)
+    w.stop_watching()
+    assert w._pending_modified == {}
+    time.sleep(0.2)
+    assert events == []  # nothing fires after stop
+
+
+def test_throttle_state_fixed_size(tmp_path):
+    """Throttle state is a fixed slot array — constant memory (H-19)."""
+    from observantic.monitors.file import _THROTTLE_SLOTS
+
+    w = FileEventBase(event_throttle_seconds=10.0)
+    assert w._should_throttle("busy.txt") is False
+    for i in range(_THROTTLE_SLOTS * 2):
+        w._should_throttle(f"path-{i}")
+    assert len(w._throttle_slots) == _THROTTLE_SLOTS  # never grows
+    # A path seen inside its window stays throttled.
+    assert w._should_throttle("busy.txt") is True
+
+
+def test_nested_watcher_shares_ancestor_watch(tmp_path):
+    """A recursive watch on an ancestor is reused; events are scoped down."""
+    parent_events, child_events = [], []
+    sub = tmp_path / "sub"
+    sub.mkdir()
+
+    class P(FileEventBase):
+        def on_file_created(self, event):
+            parent_events.append(str(event.src_path))
+
+    class C(FileEventBase):
+        def on_file_created(self, event):
+            child_events.append(str(event.src_path))
+
+    p, c = P(), C()
+    p.start_watching(str(tmp_path))
+    c.start_watching(str(sub))
+    try:
+        assert c._watch is p._watch  # consolidated — no second kernel watch
+        (tmp_path / "outside.txt").write_text("x")
+        (sub / "inside.txt").write_text("x")
+        assert wait_for(lambda: len(parent_events) >= 2), parent_events
+        assert wait_for(lambda: len(child_events) >= 1), child_events
+        time.sleep(0.3)
+        # The child never sees events outside its own subtree.
+        assert all(s.endswith("inside.txt") for s in child_events), child_events
+    finally:
+        c.stop_watching()
+        p.stop_watching()
 
 
 def test_raising_hook_does_not_kill_observer(tmp_path):
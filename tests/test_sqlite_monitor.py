@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import sqlite3
 import time
+import uuid
 
 import pytest
-from watchdog.events import FileSystemEventHandler
 
 from observantic import SQLiteEventBase
 from observantic.exceptions import ConfigurationException
@@ -22,17 +22,24 @@ def wait_for(predicate, timeout=5.0, interval=0.05):
 
 
 @pytest.fixture
-def db(tmp_path):
-    p = tmp_path / "watch.db"
-    conn = sqlite3.connect(p)
-    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT)")
-    conn.commit()
-    conn.close()
-    return p
+def db():
+    """Shared-cache in-memory database: the suite skips disk I/O and fsync.
+
+    The anchor connection keeps the database alive for the test; a uuid
+    name isolates each test's shared-cache namespace. PRAGMA data_version
+    propagates between shared-cache connections, so detection behaves
+    exactly as it does on a file.
+    """
+    uri = f"file:{uuid.uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    anchor.execute("CREATE TABLE t (id INTEGER PRIMARY KEY AUTOINCREMENT, data TEXT)")
+    anchor.commit()
+    yield uri
+    anchor.close()
 
 
 def insert(db, data):
-    conn = sqlite3.connect(db)
+    conn = sqlite3.connect(db, uri=True)
     conn.execute("INSERT INTO t (data) VALUES (?)", (data,))
     conn.commit()
     conn.close()
@@ -42,15 +49,8 @@ def test_inserts_detected(db):
     inserted, changed = [], []
 
     class W(SQLiteEventBase):
-        def _create_handler(self):
-            # Suppress watchdog delivery: only the poll thread checks, so the
-            # three inserts land in a single deterministic diff.
-            class Noop(FileSystemEventHandler):
-                def on_modified(self, event):
-                    pass
-
-            return Noop()
-
+        # Detection is poll-driven (data_version gate), so the three
+        # inserts land in a single deterministic diff on the next tick.
         def on_row_inserted(self, row):
             inserted.append(row)
 
@@ -58,7 +58,7 @@ def test_inserts_detected(db):
             changed.append(new_rows)
 
     w = W(poll_interval_seconds=0.4)
-    w.start_watching(str(db))
+    w.start_watching(db)
     try:
         insert(db, "a")
         insert(db, "b")
@@ -80,16 +80,15 @@ def test_update_detected(db):
         def on_row_updated(self, row):
             updated.append(row)
 
-    conn = sqlite3.connect(db)
+    conn = sqlite3.connect(db, uri=True)
     conn.execute("INSERT INTO t (data) VALUES ('orig')")
     conn.commit()
     conn.close()
 
     w = W(poll_interval_seconds=0.1)
-    w.start_watching(str(db))
+    w.start_watching(db)  # seeds the snapshot synchronously
     try:
-        time.sleep(0.3)  # let the initial snapshot settle
-        conn = sqlite3.connect(db)
+        conn = sqlite3.connect(db, uri=True)
         conn.execute("UPDATE t SET data='changed' WHERE id=1")
         conn.commit()
         conn.close()
@@ -108,16 +107,15 @@ def test_delete_detected(db):
         def on_row_deleted(self, row):
             deleted.append(row)
 
-    conn = sqlite3.connect(db)
+    conn = sqlite3.connect(db, uri=True)
     conn.execute("INSERT INTO t (data) VALUES ('gone')")
     conn.commit()
     conn.close()
 
     w = W(poll_interval_seconds=0.1)
-    w.start_watching(str(db))
+    w.start_watching(db)  # seeds the snapshot synchronously
     try:
-        time.sleep(0.3)
-        conn = sqlite3.connect(db)
+        conn = sqlite3.connect(db, uri=True)
         conn.execute("DELETE FROM t WHERE id=1")
         conn.commit()
         conn.close()
@@ -136,10 +134,9 @@ def test_schema_change_detected(db):
             schema_events.append(change)
 
     w = W(poll_interval_seconds=0.1)
-    w.start_watching(str(db))
+    w.start_watching(db)  # seeds the schema synchronously
     try:
-        time.sleep(0.3)
-        conn = sqlite3.connect(db)
+        conn = sqlite3.connect(db, uri=True)
         conn.execute("CREATE TABLE extra (id INTEGER PRIMARY KEY)")
         conn.commit()
         conn.close()
@@ -157,10 +154,9 @@ def test_schema_tracking_can_be_disabled(db):
             schema_events.append(change)
 
     w = W(poll_interval_seconds=0.1, track_schema_changes=False)
-    w.start_watching(str(db))
+    w.start_watching(db)  # seeds the schema synchronously
     try:
-        time.sleep(0.3)
-        conn = sqlite3.connect(db)
+        conn = sqlite3.connect(db, uri=True)
         conn.execute("CREATE TABLE extra2 (id INTEGER PRIMARY KEY)")
         conn.commit()
         conn.close()
@@ -179,12 +175,12 @@ def test_restart_resets_snapshots(db):
             seen.append(row.row_id)
 
     w = W(poll_interval_seconds=0.1)
-    conn = sqlite3.connect(db)
+    conn = sqlite3.connect(db, uri=True)
     conn.execute("INSERT INTO t (data) VALUES ('pre')")
     conn.commit()
     conn.close()
 
-    w.start_watching(str(db))
+    w.start_watching(db)
     try:
         time.sleep(0.3)  # snapshot taken with row 1 present
         assert seen == []  # pre-existing rows are not "new"
@@ -192,7 +188,7 @@ def test_restart_resets_snapshots(db):
         w.stop_watching()
 
     seen.clear()
-    w.start_watching(str(db))  # restart — snapshots must be fresh
+    w.start_watching(db)  # restart — snapshots must be fresh
     try:
         insert(db, "post-restart")
         assert wait_for(lambda: len(seen) == 1), seen
@@ -217,14 +213,12 @@ def test_locked_database_reports_error_and_survives(db):
             errors.append(error)
 
     w = W(poll_interval_seconds=0.05, db_connect_timeout_seconds=0.2)
-    w.start_watching(str(db))
+    w.start_watching(db)
     try:
-        time.sleep(0.3)
         # Hold an exclusive lock, then try to make the watcher check the DB.
-        blocker = sqlite3.connect(db)
+        blocker = sqlite3.connect(db, uri=True)
         blocker.execute("BEGIN EXCLUSIVE")
-        time.sleep(0.6)
-        assert len(errors) >= 1  # connect/check timed out → on_error
+        assert wait_for(lambda: len(errors) >= 1)  # check failed → on_error
         assert w._watching is True  # watcher survived
         blocker.rollback()
         blocker.close()
@@ -233,23 +227,16 @@ def test_locked_database_reports_error_and_survives(db):
 
 
 def test_poll_thread_detects_changes_without_file_events(db):
-    """H-20: poll_interval_seconds is real — detects changes when the
-    watchdog file event is suppressed."""
+    """H-20: poll_interval_seconds is real — the poll thread alone detects
+    foreign writes (no filesystem events are involved at all)."""
     inserted = []
 
     class W(SQLiteEventBase):
-        def _create_handler(self):
-            class Noop(FileSystemEventHandler):
-                def on_modified(self, event):
-                    pass  # suppress watchdog delivery; poll must detect
-
-            return Noop()
-
         def on_row_inserted(self, row):
             inserted.append(row)
 
     w = W(poll_interval_seconds=0.1)
-    w.start_watching(str(db))
+    w.start_watching(db)
     try:
         insert(db, "polled")
         assert wait_for(lambda: len(inserted) == 1, timeout=5.0), inserted